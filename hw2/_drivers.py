@@ -0,0 +1,118 @@
+"""
+This module holds the iteration driver and the per-method update steps shared
+by the root-finding scripts.
+
+The update steps are pure arithmetic; function evaluations stay in the
+callers.
+"""
+from math import copysign, sqrt
+
+import numpy as np
+
+# Exit status of an iteration
+CONVERGED = 0
+FAILED = 1
+MAX_ITER_REACHED = 2
+
+
+def run_iteration(step, state, stop, max_iter, row_shape, start=1, head=()):
+    """
+    Runs a root-finding iteration.
+
+    Logged rows are written into a table preallocated for max_iter rows, with
+    NaN (e.g. from a None entry) marking missing values.
+
+    Args:
+        step: Function (n, state) -> (new_state, row) performing iteration n,
+            where row is the record to log. It returns None when the update
+            is undefined (e.g. a zero denominator).
+        state: The initial state.
+        stop: Predicate on the new state; the loop ends when it returns True.
+        max_iter: Maximum number of iterations.
+        row_shape: Shape of one logged row, or None to not log rows.
+        start: Number of the first iteration.
+        head: Rows placed in the table before the iteration rows, such as the
+            initial guesses.
+
+    Returns:
+        (state, table, status, n) where table holds the logged rows (None if
+        row_shape is None), status is one of CONVERGED, FAILED or
+        MAX_ITER_REACHED and n is the number of the last iteration attempted.
+    """
+    table = None
+    count = len(head)
+    if row_shape is not None:
+        table = np.full((count + max_iter,) + tuple(row_shape), np.nan)
+        if count:
+            table[:count] = head
+
+    status = MAX_ITER_REACHED
+    n = start - 1
+    for n in range(start, start + max_iter):
+        result = step(n, state)
+        if result is None:
+            status = FAILED
+            break
+        state, row = result
+        if table is not None:
+            table[count] = row
+            count += 1
+        if stop(state):
+            status = CONVERGED
+            break
+    return state, None if table is None else table[:count], status, n
+
+
+def opposite_signs(x, y):
+    """
+    Tests whether x and y are nonzero with opposite signs.
+
+    Equivalent to x * y < 0, but without the multiply, which can underflow to
+    zero (hiding a sign change) for very small |x| and |y|. Works on floats
+    and element-wise on NumPy arrays.
+
+    Returns: True (or a boolean array) where the signs are strictly opposite.
+    """
+    return ((x < 0) & (y > 0)) | ((x > 0) & (y < 0))
+
+
+def bisect_step(an, bn, fan, pn, fpn, active):
+    """
+    Halves each active bracket, keeping the half that contains a sign change.
+
+    Operates on NumPy arrays of brackets; inactive entries are left unchanged.
+
+    Returns: The new (a_n, b_n, f(a_n)).
+    """
+    mask = opposite_signs(fan, fpn)
+    bn = np.where(active & mask, pn, bn)
+    # When a_n moves to p_n, f(p_n) becomes the new f(a_n)
+    move_a = active & ~mask
+    an = np.where(move_a, pn, an)
+    fan = np.where(move_a, fpn, fan)
+    return an, bn, fan
+
+
+def secant_step(p_prev, p_curr, f_prev, f_curr):
+    """
+    Secant update through (p_{n-1}, f(p_{n-1})) and (p_n, f(p_n)).
+    """
+    return p_curr - f_curr * (p_curr - p_prev) / (f_curr - f_prev)
+
+
+def false_position_step(a, b, fa, fb):
+    """
+    False position update: the root of the chord through (a, f(a)) and (b, f(b)).
+    """
+    return a - fa * (b - a) / (fb - fa)
+
+
+def ridders_step(a, c, fa, fb, fc):
+    """
+    Ridders update from the bracket end a, the midpoint c and f at a, b and c.
+    """
+    s = sqrt(fc * fc - fa * fb)
+    if s == 0:
+        # f(c) = 0 and the bracket has collapsed onto the root
+        return c
+    return c + (c - a) * copysign(1.0, fa - fb) * fc / s
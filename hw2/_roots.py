@@ -0,0 +1,48 @@
+"""
+This module holds helpers shared by the root-finding scripts.
+"""
+import csv
+from math import isnan, log10
+
+
+def tolerance_format(tolerance):
+    """
+    Builds the printf-style output format matching a tolerance of 10^-n.
+
+    A tolerance of 10^-n is shown with n + 1 significant digits. Tolerances
+    outside (0, 1), for which log10 fails or gives no digits, use 10.
+
+    Args:
+        tolerance: The error tolerance of the method.
+
+    Returns: The format string, e.g. '%.4g' for a tolerance of 1e-3.
+    """
+    digits = max(1, int(-log10(tolerance)) + 1) if 0 < tolerance < 1 else 10
+    return f'%.{digits}g'
+
+
+def write_results(output_file, header, table, fmt='%.7g'):
+    """
+    Writes the iteration table of a root-finding method to a CSV file.
+
+    The table holds raw floats; formatting happens here, once, at write time.
+
+    Args:
+        output_file: Name of the CSV file to write results to.
+        header: Column names for the first row.
+        table: Float array of per-iteration rows whose first column is the
+            iteration number and whose last column is the error. A NaN error
+            in the first row means there is no previous estimate yet and is
+            written as N/A; any other NaN is a real value, written as nan.
+        fmt: printf-style format applied to the remaining columns.
+    """
+    rows = table.tolist()
+    if rows and isnan(rows[0][-1]):
+        rows[0][-1] = None
+    rows = ([int(row[0])] + ["N/A" if value is None else fmt % value for value in row[1:]]
+            for row in rows)
+    with open(output_file, mode='w', newline='', encoding='utf-8', buffering=65536) as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+    print(f"Results written to {output_file}")
@@ -1,62 +1,158 @@
 """
 This module implements the bisection method for root finding.
+
+The method is vectorized with NumPy so that many brackets can be solved at
+once: ``func`` is evaluated a single time per iteration over the whole batch.
 """
-import csv
+import numpy as np
+
+from _drivers import MAX_ITER_REACHED, bisect_step, opposite_signs, run_iteration
+from _roots import write_results
+
+# Number of points sampled over [a, b] when the endpoints do not bracket a root
+BRACKET_GRID_POINTS = 17
 
 
-def bisection_method(func, a, b, tolerance, max_iter=100):
+def bisection_method(func, a, b, tolerance, max_iter=100,
+                     output_file="bisection_results.csv", write_csv=True, history=True):
     """
     Implements the Bisection Method to find a root of a function.
 
+    If f(a) and f(b) have the same sign, f is sampled once on a uniform grid
+    over [a, b] and the first sub-interval with a sign change is used instead.
+    An exact zero of f at an end or a grid point is returned as the root.
+
     Args:
-        func: The function for which to find the root.
-        a: The lower bound of the interval [a, b].
-        b: The upper bound of the interval [a, b].
+        func: The function for which to find the root. It must accept a NumPy
+            array and evaluate element-wise (e.g. a ufunc expression).
+        a: The lower bound(s) of the interval [a, b]. Scalar or array of any
+            shape, broadcast against b.
+        b: The upper bound(s) of the interval [a, b]. Scalar or array.
         tolerance: The error tolerance. The method stops when (b - a) / 2 < tolerance.
         max_iter: The maximum number of iterations.
+        output_file: Name of the CSV file to write results to.
+        write_csv: If False, skip the CSV file and return the iteration table
+            as an array instead.
+        history: If False (and write_csv is False), do not record the
+            iteration table and return only the root(s).
 
     Returns:
-        None (writes to CSV file)
+        The approximated root(s): a float for scalar brackets, otherwise an
+        array of the broadcast shape of a and b. Brackets without any sign
+        change give None (scalar) or NaN.
+        When write_csv is False, (root, iterations) with iterations as a float
+        array holding the rows of each bracket in turn, or just the root(s) if
+        history is also False.
     """
-    # Check if a root is bracketed
-    # If not, pick a new interval within the interval [a, b]
-    while func(a) * func(b) >= 0:
-        a = a + 0.5
-        b = b - 0.5
-    iterations = []
+    scalar_input = np.ndim(a) == 0 and np.ndim(b) == 0
+    an, bn = np.broadcast_arrays(np.atleast_1d(np.asarray(a, dtype=np.float64)),
+                                 np.atleast_1d(np.asarray(b, dtype=np.float64)))
+    shape = an.shape
+    # Order each bracket so that the error bound (b_n - a_n)/2 is positive, and
+    # flatten the batch so that each logged row is (6, number of brackets)
+    an, bn = np.minimum(an, bn).ravel(), np.maximum(an, bn).ravel()
+    # The iteration table is only built when it is written or returned
+    history = write_csv or history
+
     # Header for CSV
     header = ["Iteration (n)", "$a_n$", "$b_n$", "$p_n$",
               "$f(p_n)$", "Error $(b_n - a_n)/2$"]
-    an = a
-    bn = b
-    for n in range(1, max_iter + 1):
+
+    if an.size == 0:
+        print("No brackets given.")
+        roots, iterations = np.empty(shape), np.empty((0, 6))
+        if not write_csv:
+            return (roots, iterations) if history else roots
+        write_results(output_file, header, iterations)
+        return roots
+
+    # f(a_n) is carried across iterations so func is evaluated once per step
+    fan = func(an)
+
+    # Check if a root is bracketed
+    fbn = func(bn)
+    bracketed = opposite_signs(fan, fbn)
+    # An exact zero at an end is a root: collapse the bracket onto it
+    zero_a = ~bracketed & (fan == 0)
+    zero_b = ~bracketed & ~zero_a & (fbn == 0)
+    bn[zero_a] = an[zero_a]
+    an[zero_b] = bn[zero_b]
+    fan[zero_b] = 0.0
+    bracketed |= zero_a | zero_b
+
+    # If not, pick the first sub-interval of a grid over [a, b] with a sign change,
+    # or collapse onto the first grid point where f is exactly zero
+    if not bracketed.all():
+        search = ~bracketed
+        xs = np.linspace(an[search], bn[search], BRACKET_GRID_POINTS)
+        ys = func(xs)
+        zero = ys[1:] == 0
+        change = opposite_signs(ys[:-1], ys[1:]) | zero
+        idx = change.argmax(axis=0)
+        cols = np.arange(idx.size)
+        hit_zero = zero[idx, cols]
+        an[search] = np.where(hit_zero, xs[idx + 1, cols], xs[idx, cols])
+        bn[search] = xs[idx + 1, cols]
+        fan[search] = np.where(hit_zero, 0.0, ys[idx, cols])
+        bracketed[search] = change.any(axis=0)
+    if not bracketed.all():
+        if scalar_input:
+            print("No sign change found in [a, b]. Bisection method fails.")
+            if write_csv or not history:
+                return None
+            return None, np.empty((0, 6))
+        print(f"No sign change found in {np.count_nonzero(~bracketed)} brackets; "
+              "their roots are NaN.")
+
+    roots = np.full_like(an, np.nan)
+
+    def step(n, state):
+        an, bn, fan, _, active = state
         # Midpoint
-        pn = (an + bn) / 2
+        pn = 0.5 * (an + bn)
         fpn = func(pn)
         # Error bound
-        error = (bn - an) / 2
-        # Store iteration data
-        # n, a_n, b_n, p_n, f(p_n), Error
-        # Round to 7 decimal places
-        iterations.append([n, round(an, 7), round(bn, 7),
-                           round(pn, 7), round(fpn, 7), round(error, 7)])
-        # Check convergence
-        if error < tolerance or fpn == 0:
-            print(f"Converged to root: {pn} after {n} iterations.")
-            break
-        # Determine new interval
-        if func(an) * fpn < 0:
-            bn = pn
-        else:
-            an = pn
-    else:
+        error = 0.5 * (bn - an)
+        # (active mask, a_n, b_n, p_n, f(p_n), Error) for the whole batch
+        row = (active, an, bn, pn, fpn, error)
+        # Check convergence; converged brackets stop updating
+        done = active & ((error < tolerance) | (fpn == 0))
+        roots[done] = pn[done]
+        active = active & ~done
+        if active.any():
+            an, bn, fan = bisect_step(an, bn, fan, pn, fpn, active)
+        return (an, bn, fan, pn, active), row
+
+    # p_n is seeded with the midpoint so that max_iter == 0 still yields an estimate
+    state, table, status, n = run_iteration(
+        step, (an, bn, fan, 0.5 * (an + bn), bracketed), lambda state: not state[4].any(),
+        max_iter, (6, an.size) if history else None)
+    _, _, _, pn, active = state
+    if status == MAX_ITER_REACHED:
+        roots[active] = pn[active]
+
+    if active.any():
         print("Maximum iterations reached without convergence.")
-    # Write to CSV
-    with open('bisection_results.csv', mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(header)
-        writer.writerows(iterations)
-    print("Results written to bisection_results.csv")
+    elif scalar_input:
+        print(f"Converged to root: {roots[0]} after {n} iterations.")
+    else:
+        print(f"Converged {np.count_nonzero(bracketed)} roots after {n} iterations.")
+
+    root = float(roots[0]) if scalar_input else roots.reshape(shape)
+    if not history:
+        return root
+
+    # One row per iteration of each bracket, grouped per bracket: nonzero on the
+    # (bracket, iteration) mask yields the rows already in that order
+    k, t = np.nonzero(table[:, 0, :].T == 1)
+    iterations = np.column_stack((t + 1, table[t, 1:, k]))
+
+    if not write_csv:
+        return root, iterations
+
+    write_results(output_file, header, iterations)
+
+    return root
 
 
 if __name__ == "__main__":
@@ -69,7 +165,8 @@ if __name__ == "__main__":
 
         Returns: The value of the function at x.
         """
-        return x**3 - 3 * x**2 + 2 * x - 0.1
+        # x^3 - 3x^2 + 2x - 0.1 in Horner form: no pow calls, and better conditioned
+        return ((x - 3.0) * x + 2.0) * x - 0.1
 
     A_INITIAL = 0.0
     B_INITIAL = 2.0
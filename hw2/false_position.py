@@ -1,11 +1,14 @@
 """
 This module implements the False Position Method (Regula Falsi) for root finding.
 """
-import csv
-import math
+from math import exp
 
+from _drivers import CONVERGED, FAILED, false_position_step, opposite_signs, run_iteration
+from _roots import tolerance_format, write_results
 
-def false_position(func, a, b, tolerance, max_iter=50, output_file="false_position_results.csv"):
+
+def false_position(func, a, b, tolerance, max_iter=50, output_file="false_position_results.csv",
+                   write_csv=True):
     """
     Implements the False Position Method (Regula Falsi) to find a root of a function.
 
@@ -16,78 +19,83 @@ def false_position(func, a, b, tolerance, max_iter=50, output_file="false_positi
         tolerance: Error tolerance (10^-n). The loop stops when |p_n - p_{n-1}| < tolerance.
         max_iter: Maximum number of iterations to prevent infinite loops.
         output_file: Name of the CSV file to write results to.
+        write_csv: If False, skip the CSV file and return the iteration table
+            as an array instead.
+
+    Returns:
+        The approximated root, or None on a zero denominator. When write_csv
+        is False, (root, iterations) with iterations as a float array (NaN
+        where there is no error yet).
     """
 
-    # Format: (iteration, p_n, error)
-    iterations = []
+    # Output format, built once and applied at write time
+    fmt = tolerance_format(tolerance)
 
-    # Calculate decimal places for rounding
-    decimal_places = int(-math.log10(tolerance)) + 1
+    # f(current_a) and f(current_b) are carried across iterations
+    fa = func(a)
+    fb = func(b)
 
     # Check if initial guesses bracket the root
-    if func(a) * func(b) >= 0:
+    if not opposite_signs(fa, fb):
         print("Warning: Initial guesses do not bracket the root. The method may fail.")
         # Proceeding anyway as per "similar to secant" request, though standard FP requires bracket.
 
     # Store initial guesses similar to Secant script
     # Iteration 0: a
     # Iteration 1: b
-    iterations.append((0, round(a, decimal_places), "N/A"))
-    iterations.append((1, round(b, decimal_places),
-                      round(abs(b - a), decimal_places)))
-
-    p_prev = b
-    current_a = a
-    current_b = b
-
-    # Main loop
-    for i in range(2, max_iter + 2):
-        fa = func(current_a)
-        fb = func(current_b)
+    # Format: (iteration, p_n, error)
+    head = [(0, a, None), (1, b, abs(b - a))]
 
+    def step(i, state):
+        current_a, current_b, fa, fb, p_prev, _ = state
         if fb - fa == 0:
-            print("Division by zero error in False Position Method.")
-            break
+            return None
 
         # Calculate p_next (root approximation)
         # Use the secant method formula
-        p_next = current_a - fa * (current_b - current_a) / (fb - fa)
+        p_next = false_position_step(current_a, current_b, fa, fb)
 
         # Calculate error (change from previous estimate)
         error = abs(p_next - p_prev)
 
-        # Store result
-        iterations.append((i, round(p_next, decimal_places),
-                          round(error, decimal_places)))
-
-        # Check tolerance
-        if error < tolerance:
-            print(f"Converged to root: {p_next} after {i} iterations.")
-            break
-
-        # Update bracket
+        # Update bracket unless converged
         # If f(current_a) and f(p_next) have opposite signs, root is in [current_a, p_next]
         # otherwise root is in [p_next, current_b]
-        if func(current_a) * func(p_next) < 0:
-            current_b = p_next
-            # current_a stays same
-        else:
-            current_a = p_next
-            # current_b stays same
-
-        p_prev = p_next
+        if error >= tolerance:
+            fp_next = func(p_next)
+            if opposite_signs(fa, fp_next):
+                current_b = p_next
+                fb = fp_next
+                # current_a stays same
+            else:
+                current_a = p_next
+                fa = fp_next
+                # current_b stays same
+
+        return (current_a, current_b, fa, fb, p_next, error), (i, p_next, error)
 
+    # Main loop
+    state, iterations, status, i = run_iteration(
+        step, (a, b, fa, fb, b, None), lambda state: state[5] < tolerance, max_iter, (3,),
+        start=2, head=head)
+
+    if status == CONVERGED:
+        print(f"Converged to root: {state[4]} after {i} iterations.")
+    elif status == FAILED:
+        print("Division by zero error in False Position Method.")
     else:
         print("Maximum iterations reached without convergence.")
 
+    # The last logged p_n is the final approximation, unless the update failed
+    root = None if status == FAILED else float(iterations[-1, 1])
+    if not write_csv:
+        return root, iterations
+
     # Write to CSV
-    with open(output_file, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(["$n$", "$p_n$", "Error $|p_n - p_{n-1}|$"])
-        for row in iterations:
-            writer.writerow(row)
+    write_results(output_file, ["$n$", "$p_n$", "Error $|p_n - p_{n-1}|$"], iterations,
+                  fmt)
 
-    print(f"Results written to {output_file}")
+    return root
 
 
 if __name__ == "__main__":
@@ -100,7 +108,7 @@ if __name__ == "__main__":
 
         Returns: The value of the function at x.
         """
-        return math.e**(-x) - 0.2
+        return exp(-x) - 0.2
 
     P0 = 0.0
     P1 = 2.0
@@ -0,0 +1,71 @@
+"""
+This module implements fixed-point iteration for root finding.
+
+The iteration is vectorized with NumPy so that many starting points can be
+iterated at once, e.g. to map out the basin of attraction of a fixed point.
+"""
+import numpy as np
+
+from _drivers import MAX_ITER_REACHED, run_iteration
+
+
+def fixed_point_iteration(g, p0, tolerance, max_iter=100,
+                          output_file="fixed_point_trajectories.npz"):
+    """
+    Implements Fixed-Point Iteration p_n = g(p_{n-1}) from many starting points.
+
+    Args:
+        g: The iteration function. It must accept a NumPy array and evaluate
+            element-wise (e.g. np.cos).
+        p0: Starting point(s). Scalar or array.
+        tolerance: Error tolerance. A starting point stops iterating once
+            |p_n - p_{n-1}| < tolerance.
+        max_iter: Maximum number of iterations.
+        output_file: Name of the compressed .npz file the trajectories are
+            written to, or None to skip writing.
+
+    Returns:
+        The approximated fixed point(s): a float for a scalar p0, otherwise an array.
+    """
+    scalar_input = np.ndim(p0) == 0
+    p = np.atleast_1d(np.asarray(p0, dtype=np.float64)).copy()
+    counts = np.zeros(p.shape, dtype=np.int64)
+
+    def step(n, state):
+        p, active = state
+        p_new = g(p)
+        error = np.abs(p_new - p)
+        # Converged starting points keep their last value
+        p = np.where(active, p_new, p)
+        counts[active] = n
+        active = active & ~(error < tolerance)
+        return (p, active), p
+
+    # Row 0 of the trajectory holds the starting points
+    state, trajectory, status, n = run_iteration(
+        step, (p, np.ones(p.shape, dtype=bool)), lambda state: not state[1].any(), max_iter,
+        p.shape, head=[p])
+    p, active = state
+
+    if status == MAX_ITER_REACHED:
+        print(f"Maximum iterations reached without convergence for "
+              f"{np.count_nonzero(active)} of {p.size} starting points.")
+    elif scalar_input:
+        print(f"Converged to fixed point: {p[0]} after {n} iterations.")
+    else:
+        print(f"Converged {p.size} starting points after {n} iterations.")
+
+    if output_file is not None:
+        # Trajectory rows are iterations, columns are starting points
+        np.savez_compressed(output_file, p0=trajectory[0], trajectory=trajectory,
+                            iterations=counts, converged=~active)
+        print(f"Results written to {output_file}")
+
+    return float(p[0]) if scalar_input else p
+
+
+if __name__ == "__main__":
+    P0 = np.linspace(-3.0, 3.0, 13)
+    TOLERANCE = 1e-6
+
+    fixed_point_iteration(np.cos, P0, TOLERANCE)
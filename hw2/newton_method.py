@@ -1,65 +1,141 @@
 """
 This module implements Newton's method for root finding.
+
+The iteration itself runs in a Numba-compiled kernel; printing and CSV output
+stay in the pure-Python wrapper.
 """
-import csv
+import sys
+from math import isnan
+
+import numpy as np
+
+from _drivers import CONVERGED, FAILED, MAX_ITER_REACHED
+from _roots import write_results
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback no-op decorator used when Numba is not installed.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 
-def newton_method(func, d_func, x0, tolerance, max_iter=50):
+# Not cached: f and df are arguments whose Numba types differ in every process,
+# so an on-disk cache entry would never be hit and would pile up in __pycache__
+@njit(fastmath=True)
+def _newton_core(f, df, x0, tolerance, max_iter):
     """
-    Implements Newton's Method to find a root of a function.
+    Runs the Newton iteration.
 
     Args:
-        func: The function f(x).
-        d_func: The derivative of the function f'(x).
+        f: The function f(x), compiled with @njit.
+        df: The derivative f'(x), compiled with @njit.
         x0: Initial guess.
         tolerance: Error tolerance.
         max_iter: Maximum number of iterations.
+
+    Returns:
+        (xs, fxs, dfxs, errs, n_final, root, status) where the arrays hold the
+        first n_final iterations, errs[0] is NaN (no previous estimate) and
+        status is one of CONVERGED, FAILED (zero derivative) or MAX_ITER_REACHED.
     """
-    iterations = []
+    xs = np.empty(max_iter)
+    fxs = np.empty(max_iter)
+    dfxs = np.empty(max_iter)
+    errs = np.empty(max_iter)
 
     xn = x0
-    error = None
-
-    print(f"{'n':<5} {'x_n':<20} {'f(x_n)':<20} {'f\'(x_n)':<20} {'Error':<20}")
-
+    error = np.nan
     for n in range(max_iter):
-        fx = func(xn)
-        dfx = d_func(xn)
+        fx = f(xn)
+        dfx = df(xn)
 
         # Avoid division by zero
         if dfx == 0:
-            print("Derivative is zero. Newton's method fails.")
-            return None
+            return xs[:n], fxs[:n], dfxs[:n], errs[:n], n, xn, FAILED
         x_next = xn - fx / dfx
 
-        # Store iteration data
-        # Round to 7 decimal places
-        iterations.append((n, round(xn, 7), round(fx, 7),
-                            round(dfx, 7), round(error, 7) if error is not None else "N/A"))
-
-        error_str = f"{error:.10f}" if error is not None else "N/A"
-        print(f"{n:<5} {xn:<20.10f} {fx:<20.10f} {dfx:<20.10f} {error_str:<20}")
+        xs[n] = xn
+        fxs[n] = fx
+        dfxs[n] = dfx
+        errs[n] = error
 
         # Check for convergence
         if abs(x_next - xn) < tolerance:
-            print(f"\nConverged to root: {x_next} after {n+1} iterations.")
-            break
+            return xs[:n + 1], fxs[:n + 1], dfxs[:n + 1], errs[:n + 1], n + 1, x_next, CONVERGED
 
         error = abs(x_next - xn)
         xn = x_next
+
+    return xs, fxs, dfxs, errs, max_iter, xn, MAX_ITER_REACHED
+
+
+def newton_method(func, d_func, x0, tolerance, max_iter=50, write_csv=True, verbose=False):
+    """
+    Implements Newton's Method to find a root of a function.
+
+    Args:
+        func: The function f(x). Must be decorated with @njit when Numba is
+            installed, since it is called from the compiled kernel.
+        d_func: The derivative of the function f'(x). Must be decorated with
+            @njit when Numba is installed.
+        x0: Initial guess.
+        tolerance: Error tolerance.
+        max_iter: Maximum number of iterations.
+        write_csv: If False, skip the CSV file and return the iteration table
+            as an array instead.
+        verbose: If True, print the per-iteration table.
+
+    Returns:
+        The approximated root, or None if the derivative vanished. When
+        write_csv is False, (root, iterations) with iterations as a float array
+        (NaN where there is no error yet) holding the iterations done.
+    """
+    xs, fxs, dfxs, errs, n_final, root, status = _newton_core(
+        func, d_func, float(x0), float(tolerance), max_iter)
+
+    # Iteration table: (n, p_n, f(p_n), f'(p_n), error); rounding happens at write time
+    iterations = np.column_stack((np.arange(n_final), xs, fxs, dfxs, errs))
+
+    if verbose:
+        lines = ["{:<5} {:<20} {:<20} {:<20} {:<20}".format(
+            "n", "x_n", "f(x_n)", "f'(x_n)", "Error")]
+        # Unbox the kernel output once; per-row work below uses plain floats and math
+        rows = zip(range(n_final), xs.tolist(), fxs.tolist(), dfxs.tolist(), errs.tolist())
+        for n, xn, fx, dfx, error in rows:
+            error_str = "N/A" if isnan(error) else f"{error:.10f}"
+            lines.append(f"{n:<5} {xn:<20.10f} {fx:<20.10f} {dfx:<20.10f} {error_str:<20}")
+        # One write for the whole table instead of a print per row
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    if status == FAILED:
+        print("Derivative is zero. Newton's method fails.")
+        return None if write_csv else (None, iterations)
+    # Blank line after the table when it was printed
+    separator = "\n" if verbose else ""
+    if status == CONVERGED:
+        print(f"{separator}Converged to root: {root} after {n_final} iterations.")
     else:
-        print("\nMaximum iterations reached without convergence.")
+        print(f"{separator}Maximum iterations reached without convergence.")
+
+    if not write_csv:
+        return root, iterations
 
     # Write results to CSV (optional but useful)
-    with open('newton_results.csv', mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(["Iteration (n)", "$p_n$", "$f(p_n)$",
-                        "$f'(p_n)$", "Error $|p_n - p_{n-1}|$"])
-        writer.writerows(iterations)
-        print("Results written to newton_results.csv")
+    write_results('newton_results.csv',
+                  ["Iteration (n)", "$p_n$", "$f(p_n)$",
+                   "$f'(p_n)$", "Error $|p_n - p_{n-1}|$"],
+                  iterations)
+
+    return root
 
 
 if __name__ == "__main__":
+    @njit
     def f(x):
         """
         The function to find the root of.
@@ -69,8 +145,10 @@ if __name__ == "__main__":
 
         Returns: The value of the function at x.
         """
-        return x**3 - 3 * x**2 + 2 * x - 0.1
+        # x^3 - 3x^2 + 2x - 0.1 in Horner form: no pow calls, and better conditioned
+        return ((x - 3.0) * x + 2.0) * x - 0.1
 
+    @njit
     def df(x):
         """
         The derivative of the function to find the root of.
@@ -80,9 +158,10 @@ if __name__ == "__main__":
 
         Returns: The value of the derivative of the function at x.
         """
-        return 3*x**2 - 6*x + 2
+        # 3x^2 - 6x + 2 in Horner form
+        return (3.0 * x - 6.0) * x + 2.0
 
     INITIAL_GUESS = 1.5
     TOLERANCE = 1e-3
 
-    newton_method(f, df, INITIAL_GUESS, TOLERANCE)
+    newton_method(f, df, INITIAL_GUESS, TOLERANCE, verbose=True)
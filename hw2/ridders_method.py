@@ -0,0 +1,127 @@
+"""
+This module implements Ridders' method for root finding.
+"""
+import numpy as np
+
+from _drivers import CONVERGED, opposite_signs, ridders_step, run_iteration
+from _roots import write_results
+
+
+def ridders_method(func, a, b, tolerance, max_iter=50, output_file="ridders_results.csv",
+                   write_csv=True):
+    """
+    Implements Ridders' Method to find a root of a function.
+
+    Each iteration evaluates the function at the bracket midpoint c and at the
+    exponentially corrected point p = c + (c - a) * sign(f(a) - f(b)) * f(c) / s,
+    where s = sqrt(f(c)^2 - f(a) f(b)). The bracket is then shrunk so that it
+    still contains a sign change. Convergence is of order about 1.83.
+
+    Args:
+        func: The function for which to find the root.
+        a: The lower bound of the interval [a, b].
+        b: The upper bound of the interval [a, b].
+        tolerance: Error tolerance. The loop stops when |p_n - p_{n-1}| < tolerance.
+        max_iter: Maximum number of iterations to prevent infinite loops.
+        output_file: Name of the CSV file to write results to.
+        write_csv: If False, skip the CSV file and return the iteration table
+            as an array instead.
+
+    Returns:
+        The approximated root (a or b itself if f is exactly zero there), or
+        None if [a, b] does not bracket a root. When
+        write_csv is False, (root, iterations) with iterations as a float array
+        (NaN where there is no error yet).
+    """
+    fa = func(a)
+    fb = func(b)
+
+    header = ["Iteration (n)", "$a_n$", "$b_n$", "$p_n$", "$f(p_n)$",
+              "Error $|p_n - p_{n-1}|$"]
+
+    # An exact zero at an end is the root; no iteration is needed
+    if fa == 0 or fb == 0:
+        root = a if fa == 0 else b
+        print(f"Converged to root: {root} after 0 iterations.")
+        iterations = np.empty((0, 6))
+        if not write_csv:
+            return root, iterations
+        write_results(output_file, header, iterations)
+        return root
+
+    # Check if a root is bracketed
+    if not opposite_signs(fa, fb):
+        print("Initial guesses do not bracket the root. Ridders' method fails.")
+        return None if write_csv else (None, np.empty((0, 6)))
+
+    def step(n, state):
+        a, b, fa, fb, p_prev, _, _ = state
+        # The bracket update can leave b < a; keep a_n as the lower bound.
+        # Ridders' update is symmetric in the two ends, so swapping is safe.
+        if a > b:
+            a, b, fa, fb = b, a, fb, fa
+        c = 0.5 * (a + b)
+        fc = func(c)
+        p_next = ridders_step(a, c, fa, fb, fc)
+        # ridders_step returns c itself when f(c) = 0
+        fp_next = fc if p_next == c else func(p_next)
+
+        # Calculate error (change from previous estimate)
+        error = abs(p_next - p_prev) if p_prev is not None else None
+
+        # Format: (iteration, a_n, b_n, p_n, f(p_n), error)
+        row = (n, a, b, p_next, fp_next, error)
+
+        # Update bracket so that it still contains a sign change
+        if opposite_signs(fc, fp_next):
+            a, fa = c, fc
+            b, fb = p_next, fp_next
+        elif opposite_signs(fa, fp_next):
+            b, fb = p_next, fp_next
+        else:
+            a, fa = p_next, fp_next
+
+        return (a, b, fa, fb, p_next, fp_next, error), row
+
+    def converged(state):
+        _, _, _, _, _, fp_next, error = state
+        return fp_next == 0 or (error is not None and error < tolerance)
+
+    state, iterations, status, n = run_iteration(
+        step, (a, b, fa, fb, None, None, None), converged, max_iter, (6,))
+    p_next = state[4]
+    if p_next is None:
+        # No iteration ran (max_iter == 0): fall back on the bracket midpoint
+        p_next = 0.5 * (a + b)
+
+    if status == CONVERGED:
+        print(f"Converged to root: {p_next} after {n} iterations.")
+    else:
+        print("Maximum iterations reached without convergence.")
+
+    if not write_csv:
+        return p_next, iterations
+
+    write_results(output_file, header, iterations)
+
+    return p_next
+
+
+if __name__ == "__main__":
+    def f(x):
+        """
+        The function to find the root of.
+
+        Args:
+            x: The value to evaluate.
+
+        Returns: The value of the function at x.
+        """
+        # x^3 - 3x^2 + 2x - 0.1 in Horner form: no pow calls, and better conditioned
+        return ((x - 3.0) * x + 2.0) * x - 0.1
+
+    A_INITIAL = 0.5
+    B_INITIAL = 1.5
+    TOLERANCE = 1e-3
+
+    ridders_method(f, A_INITIAL, B_INITIAL, TOLERANCE)
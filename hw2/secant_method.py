@@ -1,11 +1,12 @@
 """
 This module implements the secant method for root finding.
 """
-import csv
-import math
+from _drivers import CONVERGED, FAILED, run_iteration, secant_step
+from _roots import tolerance_format, write_results
 
 
-def secant_method(func, p0, p1, tolerance, max_iter=50, output_file="secant_results.csv"):
+def secant_method(func, p0, p1, tolerance, max_iter=50, output_file="secant_results.csv",
+                  write_csv=True):
     """
     Implements the Secant Method to find a root of a function.
 
@@ -16,55 +17,65 @@ def secant_method(func, p0, p1, tolerance, max_iter=50, output_file="secant_resu
         tolerance: Error tolerance (10^-n). The loop stops when |p_n - p_{n-1}| < tolerance.
         max_iter: Maximum number of iterations to prevent infinite loops.
         output_file: Name of the CSV file to write results to.
-    """
+        write_csv: If False, skip the CSV file and return the iteration table
+            as an array instead.
 
-    # Format: (iteration, p_n, error)
-    iterations = []
+    Returns:
+        The approximated root, or None on a zero denominator. When write_csv
+        is False, (root, iterations) with iterations as a float array (NaN
+        where there is no error yet).
+    """
 
-    decimal_places = int(-math.log10(tolerance)) + 1
+    # Output format, built once and applied at write time
+    fmt = tolerance_format(tolerance)
 
     current_p_minus_1 = p0
     current_p = p1
+    f_prev = func(current_p_minus_1)
+    f_curr = func(current_p)
 
     # Store initial guesses
-    iterations.append((0, round(current_p_minus_1, decimal_places),
-                          round(func(current_p_minus_1), decimal_places), "N/A"))
-    iterations.append((1, round(current_p, decimal_places),
-                          round(func(current_p), decimal_places),
-                          round(abs(current_p - current_p_minus_1), decimal_places)))
-
-    for i in range(2, max_iter + 2):
-        if func(current_p) - func(current_p_minus_1) == 0:
-            print(
-                f"Division by zero error in Secant Method with p0 = {current_p_minus_1} \
-                  and p1 = {current_p}."
-            )
-            break
-
-        p_next = current_p - (func(current_p) * (current_p - current_p_minus_1)
-                              ) / (func(current_p) - func(current_p_minus_1))
-
-        error = abs(p_next - current_p)
-        iterations.append((i, round(p_next, decimal_places), round(func(p_next), decimal_places),
-                           round(error, decimal_places)))
-
-        if error < tolerance:
-            print(f"Converged to root: {p_next} after {i} iterations.")
-            break
-
-        current_p_minus_1 = current_p
-        current_p = p_next
+    # Format: (iteration, p_n, f(p_n), error)
+    head = [(0, current_p_minus_1, f_prev, None),
+            (1, current_p, f_curr, abs(current_p - current_p_minus_1))]
+
+    def step(i, state):
+        p_prev, p_curr, f_prev, f_curr, _ = state
+        if f_curr - f_prev == 0:
+            return None
+
+        p_next = secant_step(p_prev, p_curr, f_prev, f_curr)
+        f_next = func(p_next)
+
+        error = abs(p_next - p_curr)
+
+        # Shift the window; only f(p_next) is new
+        return (p_curr, p_next, f_curr, f_next, error), (i, p_next, f_next, error)
+
+    state, iterations, status, i = run_iteration(
+        step, (current_p_minus_1, current_p, f_prev, f_curr, None),
+        lambda state: state[4] < tolerance, max_iter, (4,), start=2, head=head)
+
+    if status == CONVERGED:
+        print(f"Converged to root: {state[1]} after {i} iterations.")
+    elif status == FAILED:
+        print(
+            f"Division by zero error in Secant Method with p0 = {state[0]} \
+              and p1 = {state[1]}."
+        )
     else:
         print("Maximum iterations reached without convergence.")
 
-    with open(output_file, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(["Iteration (n)", "$p_n$", "$f(p_n)$",
-                        "Error $|p_n - p_{n-1}|$"])
-        for row in iterations:
-            writer.writerow(row)
+    # The last logged p_n is the final approximation, unless the update failed
+    root = None if status == FAILED else float(iterations[-1, 1])
+    if not write_csv:
+        return root, iterations
+
+    write_results(output_file,
+                  ["Iteration (n)", "$p_n$", "$f(p_n)$", "Error $|p_n - p_{n-1}|$"],
+                  iterations, fmt)
 
-    print(f"Results written to {output_file}")
+    return root
 
 
 if __name__ == "__main__":
@@ -77,7 +88,8 @@ if __name__ == "__main__":
 
         Returns: The value of the function at x.
         """
-        return x**3 - 3 * x**2 + 2 * x - 0.1
+        # x^3 - 3x^2 + 2x - 0.1 in Horner form: no pow calls, and better conditioned
+        return ((x - 3.0) * x + 2.0) * x - 0.1
 
     P0 = 0.5
     P1 = 1.5